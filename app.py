@@ -5,54 +5,255 @@ Run with: python3 app.py
 Then open: http://localhost:5000
 """
 
-import json
+import os
 import queue
 import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 from flask import Flask, Response, jsonify, render_template, request
 from playwright.sync_api import sync_playwright
 
-from audit_scripts import audit_url
+from audit_scripts import audit_on_page, new_audit_context
 
 app = Flask(__name__)
 
+# Number of long-lived Chromium instances, one per pool worker thread
+POOL_SIZE = int(os.environ.get("POOL_SIZE", "2"))
+# Max audits running or waiting before new requests are rejected with 503.
+# gunicorn.conf.py sizes its threads from the same env var and default — keep
+# the two defaults in sync.
+MAX_QUEUE = int(os.environ.get("MAX_QUEUE", "16"))
+# Relaunch a browser after this many audits to bound native memory drift
+RECYCLE_AFTER = 100
+# By default each pool thread reuses one context + page across audits (cookies
+# are cleared in between). Set FRESH_CONTEXT=true for full per-audit isolation.
+FRESH_CONTEXT = os.environ.get("FRESH_CONTEXT", "false").lower() in ("1", "true", "yes")
+# Abort image/font/media requests during audits. Set BLOCK_MEDIA=false for
+# audits that must see the page exactly as a real visit would load it.
+BLOCK_MEDIA = os.environ.get("BLOCK_MEDIA", "true").lower() in ("1", "true", "yes")
+
+_BROWSER_ARGS = ["--no-sandbox", "--disable-dev-shm-usage"]
+
 # job_id -> queue.Queue of SSE event dicts
 _jobs: dict[str, queue.Queue] = {}
+# job_id -> time.monotonic() when the job finished, for jobs still in _jobs
+_finished: dict[str, float] = {}
 _jobs_lock = threading.Lock()
 
+# Per-job event queue bound; see _send for what gets dropped when full
+_JOB_QUEUE_SIZE = 32
+
+# SSE keepalive interval, and how long a stream may go without a real event
+_HEARTBEAT_SEC = 15
+_STREAM_IDLE_TIMEOUT_SEC = 120
+
 
 def _send(q: queue.Queue, event_type: str, **kwargs):
-    q.put({"type": event_type, **kwargs})
+    """Queue an SSE event without letting a slow client grow the queue.
+
+    When the queue is full, pending "status" events are discarded to make
+    room — they are superseded by the newest one anyway. Terminal events
+    (result/error/done) are guaranteed delivery: a job emits at most three
+    of them, so after the purge there is always space.
+    """
+    event = {"type": event_type, **kwargs}
+    try:
+        q.put_nowait(event)
+    except queue.Full:
+        _drop_status_events(q)
+        q.put(event, timeout=5)
+
+
+def _drop_status_events(q: queue.Queue):
+    with q.mutex:
+        kept = [e for e in q.queue if e["type"] != "status"]
+        q.queue.clear()
+        q.queue.extend(kept)
+        q.not_full.notify_all()
+
+
+# ---------------------------------------------------------------------------
+# Browser pool
+# Each pool thread owns its own Playwright instance — sync_playwright is not
+# thread-safe and cannot be shared across threads. Browsers stay up between
+# jobs; audits share one page per thread unless FRESH_CONTEXT is set.
+# ---------------------------------------------------------------------------
+
+class _BrowserSlot:
+    """One Playwright driver + Chromium browser, owned by a single thread."""
+
+    def __init__(self, recycle_after: int):
+        self._recycle_after = recycle_after
+        self._pw = None
+        self._browser = None
+        self._page = None
+        self._uses = 0
+
+    def warm(self) -> None:
+        """Start Playwright and launch Chromium if not already running."""
+        if self._pw is None:
+            self._pw = sync_playwright().start()
+        if self._browser is None:
+            self._browser = self._pw.chromium.launch(headless=True, args=_BROWSER_ARGS)
+            self._uses = 0
+
+    def prepare(self) -> None:
+        """Make sure a live browser is up, relaunching it if it crashed or is due for recycling."""
+        if self._browser is not None and (
+            self._uses >= self._recycle_after or not self._browser.is_connected()
+        ):
+            self._close_browser()
+        self.warm()
+        self._uses += 1
+
+    def audit(self, url: str, timeout_ms: int) -> dict:
+        """Audit url on this slot's browser; call prepare() first and release() after."""
+        if self._page is None or self._page.is_closed():
+            self._page = new_audit_context(self._browser).new_page()
+        return audit_on_page(self._page, url, timeout_ms, block_media=BLOCK_MEDIA)
+
+    def release(self) -> None:
+        """Tear down after an audit: drop the context, or reset the shared page.
+
+        Kept separate from audit() so callers can deliver the result first.
+        """
+        if self._page is None:
+            return
+        if FRESH_CONTEXT:
+            self._discard_page()
+            return
+        try:
+            self._page.context.clear_cookies()
+            self._page.goto("about:blank")
+        except Exception:
+            # Unusable page — start over with a new context on the next audit
+            self._discard_page()
+
+    def _discard_page(self) -> None:
+        try:
+            self._page.context.close()
+        except Exception:
+            pass
+        self._page = None
+
+    def _close_browser(self) -> None:
+        try:
+            self._browser.close()
+        except Exception:
+            pass
+        self._browser = None
+        self._page = None
+
+    def close(self) -> None:
+        if self._browser is not None:
+            self._close_browser()
+        if self._pw is not None:
+            self._pw.stop()
+            self._pw = None
+
+
+class BrowserPool:
+    """Bounded executor whose worker threads each own a _BrowserSlot.
+
+    At most ``max_queue`` jobs may be running or waiting at once; beyond that
+    ``try_submit`` refuses new work so bursts cannot pile up unbounded.
+    """
+
+    def __init__(self, size: int, max_queue: int, recycle_after: int = RECYCLE_AFTER):
+        self._size = size
+        self._recycle_after = recycle_after
+        self._local = threading.local()
+        self._pending = threading.Semaphore(max_queue)
+        self._executor = ThreadPoolExecutor(
+            max_workers=size,
+            thread_name_prefix="browser-pool",
+            initializer=self._init_worker,
+        )
+        # The executor only spawns threads on submit: start all of them now so
+        # every browser is warm before the first audit. The barrier keeps one
+        # thread from picking up two of these tasks.
+        self._run_on_every_thread(lambda: None)
+
+    def _run_on_every_thread(self, fn) -> None:
+        barrier = threading.Barrier(self._size)
+
+        def task():
+            barrier.wait()
+            fn()
+
+        for _ in range(self._size):
+            self._executor.submit(task)
+
+    def shutdown(self) -> None:
+        """Close every browser on its owning thread, then stop the executor."""
+        self._run_on_every_thread(lambda: self._local.slot.close())
+        self._executor.shutdown(wait=True)
+
+    def _init_worker(self) -> None:
+        slot = _BrowserSlot(self._recycle_after)
+        try:
+            slot.warm()
+        except Exception:
+            pass  # retried (and reported) on the first job
+        self._local.slot = slot
+
+    def try_submit(self, job_id: str, url: str, timeout_ms: int) -> bool:
+        """Queue an audit; return False if the pool is saturated."""
+        if not self._pending.acquire(blocking=False):
+            return False
+        self._executor.submit(self._run, job_id, url, timeout_ms)
+        return True
+
+    def _run(self, job_id: str, url: str, timeout_ms: int) -> None:
+        try:
+            run_audit_job(job_id, url, timeout_ms, self._local.slot)
+        finally:
+            self._pending.release()
 
 
 # ---------------------------------------------------------------------------
 # Background audit worker
-# Each thread owns its own Playwright instance — sync_playwright is not
-# thread-safe and cannot be shared across threads.
 # ---------------------------------------------------------------------------
 
-def run_audit_job(job_id: str, url: str, timeout_ms: int):
+def run_audit_job(job_id: str, url: str, timeout_ms: int, slot: _BrowserSlot):
     q = _jobs[job_id]
     try:
-        _send(q, "status", message="Launching browser...")
-        with sync_playwright() as pw:
-            browser = pw.chromium.launch(headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"])
-            try:
-                _send(q, "status", message=f"Connecting to {url} ...")
-                result = audit_url(url, browser, timeout_ms)
-            finally:
-                browser.close()
-
-        if result.get("error"):
-            _send(q, "error", message=result["error"])
-        else:
-            _send(q, "status", message="Processing results...")
-            _send(q, "result", data=result)
+        _send(q, "status", message="Preparing browser...")
+        slot.prepare()
+        _send(q, "status", message=f"Connecting to {url} ...")
+        try:
+            result = slot.audit(url, timeout_ms)
+
+            if result.get("error"):
+                _send(q, "error", message=result["error"])
+            else:
+                _send(q, "status", message="Processing results...")
+                _send(q, "result", data=result)
+        finally:
+            # Context teardown happens after the result is already on its way
+            slot.release()
     except Exception as e:
         _send(q, "error", message=str(e))
     finally:
         _send(q, "done")
+        with _jobs_lock:
+            if job_id in _jobs:
+                _finished[job_id] = time.monotonic()
+
+
+def _sweep_finished_jobs():
+    """Drop finished jobs whose stream was never opened (or abandoned) in time."""
+    cutoff = time.monotonic() - _STREAM_IDLE_TIMEOUT_SEC
+    with _jobs_lock:
+        for job_id in [j for j, t in _finished.items() if t < cutoff]:
+            del _finished[job_id]
+            _jobs.pop(job_id, None)
+
+
+pool = BrowserPool(POOL_SIZE, MAX_QUEUE)
 
 
 # ---------------------------------------------------------------------------
@@ -77,13 +278,17 @@ def start_audit():
     timeout_sec = int(body.get("timeout", 30))
     timeout_ms = max(5, min(timeout_sec, 120)) * 1000
 
+    _sweep_finished_jobs()
+
     job_id = str(uuid.uuid4())
-    q: queue.Queue = queue.Queue()
+    q: queue.Queue = queue.Queue(maxsize=_JOB_QUEUE_SIZE)
     with _jobs_lock:
         _jobs[job_id] = q
 
-    t = threading.Thread(target=run_audit_job, args=(job_id, url, timeout_ms), daemon=True)
-    t.start()
+    if not pool.try_submit(job_id, url, timeout_ms):
+        with _jobs_lock:
+            _jobs.pop(job_id, None)
+        return jsonify({"error": "Server busy — too many audits in progress, try again shortly"}), 503
 
     return jsonify({"job_id": job_id})
 
@@ -96,20 +301,27 @@ def stream(job_id: str):
         return Response("Job not found", status=404)
 
     def generate():
+        last_event = time.monotonic()
         while True:
             try:
-                event = q.get(timeout=120)
+                event = q.get(timeout=_HEARTBEAT_SEC)
             except queue.Empty:
-                yield "data: {\"type\": \"error\", \"message\": \"Timeout waiting for results\"}\n\n"
-                break
+                if time.monotonic() - last_event >= _STREAM_IDLE_TIMEOUT_SEC:
+                    yield "data: {\"type\": \"error\", \"message\": \"Timeout waiting for results\"}\n\n"
+                    break
+                # SSE comment: keeps proxies and EventSource from timing out
+                yield ": keepalive\n\n"
+                continue
+            last_event = time.monotonic()
 
-            payload = json.dumps(event)
+            payload = orjson.dumps(event).decode()
             yield f"data: {payload}\n\n"
 
             if event["type"] in ("done", "error"):
                 # Clean up job
                 with _jobs_lock:
                     _jobs.pop(job_id, None)
+                    _finished.pop(job_id, None)
                 break
 
     return Response(
@@ -128,4 +340,7 @@ def stream(job_id: str):
 
 if __name__ == "__main__":
     print("Starting server at http://127.0.0.1:7070")
-    app.run(debug=False, threaded=True, port=7070)
+    try:
+        app.run(debug=False, threaded=True, port=7070)
+    finally:
+        pool.shutdown()
@@ -11,15 +11,21 @@ Usage:
 """
 
 import argparse
-import json
+import asyncio
 import os
+import re
 import sys
+import time
 from collections import Counter
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
-from playwright.sync_api import Browser, Page, sync_playwright
+import orjson
+from playwright.async_api import Browser as AsyncBrowser
+from playwright.async_api import async_playwright
+from playwright.sync_api import Page
 
 from vendor_map import infer_vendor_from_inline, lookup_vendor
 
@@ -29,12 +35,94 @@ _FILTERED_URL_FRAGMENTS = [
     "googletagmanager.com/gtm/preview",
     "googletagmanager.com/debug",
 ]
+_FILTER_RE = re.compile("|".join(map(re.escape, _FILTERED_URL_FRAGMENTS)), re.I)
+
+# GTM container loader: standard GTM/gtag hosts, or server-side GTM on a custom
+# domain serving /gtm.js?id=GTM-XXXX or /gtag/js?id=G-.../GTM-...
+_GTM_RE = re.compile(
+    r"googletagmanager\.com/(?:gtm\.js|gtag/js)"
+    r"|^(?=.*/gtm\.js)(?=.*id=gtm-)"
+    r"|^(?=.*/gtag/js)(?=.*id=g(?:tm)?-)",
+    re.I | re.S,
+)
+
+_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/121.0.0.0 Safari/537.36"
+)
+
+# After "load", keep listening until no script request has started or finished
+# for _SETTLE_QUIET_S seconds, for at most _SETTLE_MAX_S (late-firing GTM tags)
+_SETTLE_QUIET_S = 0.5
+_SETTLE_MAX_S = 2.0
+
+# Images, fonts and media are irrelevant to a script audit and are aborted.
+# The regex is a page.route() pattern, matched inside the Playwright driver, so
+# only requests that match reach Python. It only looks at the path (before any
+# "?" or "#"), so a script whose query string embeds an image URL is left alone.
+_BLOCKED_EXTENSIONS = [
+    "png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico",
+    "woff", "woff2", "ttf", "otf", "eot",
+    "mp4", "webm", "mp3", "ogg", "wav",
+]
+_BLOCKED_URL_RE = re.compile(
+    r"^[^?#]*\.(?:" + "|".join(_BLOCKED_EXTENSIONS) + r")(?:[?#]|$)", re.I
+)
+
+
+def _block_route(route):
+    """Abort a matched media request; scripts served from such URLs go through.
+
+    Returns the call's result so the async API can await it.
+    """
+    if route.request.resource_type == "script":
+        return route.continue_()
+    return route.abort()
+
+
+def _error_table(rows: list) -> list:
+    """Compile (substrings, message) rows into (regex, message); first match wins."""
+    return [
+        (re.compile("|".join(map(re.escape, substrings)), re.I), message)
+        for substrings, message in rows
+    ]
+
+
+# Failed script request -> short note
+_ERROR_TABLE = _error_table([
+    (("net::err_blocked_by_client", "adblock"),           "Blocked by ad blocker / browser extension"),
+    (("net::err_connection_refused",),                    "Connection refused"),
+    (("net::err_connection_timed_out", "timeout"),        "Connection timed out"),
+    (("net::err_name_not_resolved", "dns"),               "DNS resolution failed (domain not found)"),
+    (("net::err_ssl", "ssl", "certificate"),              "SSL / certificate error"),
+    (("net::err_aborted",),                               "Request aborted"),
+    (("net::err_failed",),                                "Network request failed"),
+    (("403", "forbidden"),                                "403 Forbidden"),
+    (("401", "unauthorized"),                             "401 Unauthorized"),
+    (("404", "not found"),                                "404 Not Found"),
+    (("cors", "cross-origin"),                            "Blocked by CORS policy"),
+    (("blocked",),                                        "Request blocked"),
+])
+
+# page.goto() exception -> readable message
+_PAGE_ERROR_TABLE = _error_table([
+    (("timeout",),                       "Page load timed out — site may be slow or blocking automated browsers"),
+    (("net::err_name_not_resolved",),    "Domain not found — check the URL"),
+    (("net::err_connection_refused",),   "Connection refused — site may be down"),
+    (("net::err_connection_timed_out",), "Connection timed out — site may be slow or unreachable"),
+    (("net::err_ssl", "certificate"),    "SSL certificate error"),
+    (("net::err_aborted",),              "Page load aborted — site may be blocking automated access"),
+    (("net::err_failed",),               "Network request failed — site may be blocking automated browsers"),
+    (("blocked",),                       "Page load blocked — site is rejecting automated browsers"),
+])
 
 
 # ---------------------------------------------------------------------------
 # Pure helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=4096)
 def infer_name(url: str) -> str:
     """Extract a human-readable script name from a URL."""
     if url == "inline":
@@ -56,75 +144,29 @@ def is_gtm_request(url: str) -> bool:
     """Return True if this URL is the GTM container loader.
     Covers both standard and server-side GTM (custom domain proxies).
     """
-    lower = url.lower()
-    # Standard GTM
-    if "googletagmanager.com/gtm.js" in lower:
-        return True
-    if "googletagmanager.com/gtag/js" in lower:
-        return True
-    # Server-side GTM: custom domain serving /gtm.js?id=GTM-XXXX or /gtag/js?id=...
-    if "/gtm.js" in lower and "id=gtm-" in lower:
-        return True
-    if "/gtag/js" in lower and ("id=g-" in lower or "id=gtm-" in lower):
-        return True
-    return False
+    return _GTM_RE.search(url) is not None
 
 
 def is_filtered_url(url: str) -> bool:
     """Return True if this URL should be ignored (GTM internal endpoints)."""
-    lower = url.lower()
-    return any(fragment in lower for fragment in _FILTERED_URL_FRAGMENTS)
+    return _FILTER_RE.search(url) is not None
 
 
+@lru_cache(maxsize=1024)
 def classify_error(raw: str) -> str:
     """Turn a raw Playwright/network error string into a short human-readable note."""
-    s = raw.lower()
-    if "net::err_blocked_by_client" in s or "adblock" in s:
-        return "Blocked by ad blocker / browser extension"
-    if "net::err_connection_refused" in s:
-        return "Connection refused"
-    if "net::err_connection_timed_out" in s or "timeout" in s:
-        return "Connection timed out"
-    if "net::err_name_not_resolved" in s or "dns" in s:
-        return "DNS resolution failed (domain not found)"
-    if "net::err_ssl" in s or "ssl" in s or "certificate" in s:
-        return "SSL / certificate error"
-    if "net::err_aborted" in s:
-        return "Request aborted"
-    if "net::err_failed" in s:
-        return "Network request failed"
-    if "403" in s or "forbidden" in s:
-        return "403 Forbidden"
-    if "401" in s or "unauthorized" in s:
-        return "401 Unauthorized"
-    if "404" in s or "not found" in s:
-        return "404 Not Found"
-    if "cors" in s or "cross-origin" in s:
-        return "Blocked by CORS policy"
-    if "blocked" in s:
-        return "Request blocked"
+    for pattern, message in _ERROR_TABLE:
+        if pattern.search(raw):
+            return message
     return f"Request failed: {raw[:120]}"
 
 
+@lru_cache(maxsize=1024)
 def classify_page_error(raw: str) -> str:
     """Turn a page.goto() exception into a readable message."""
-    s = raw.lower()
-    if "timeout" in s:
-        return "Page load timed out — site may be slow or blocking automated browsers"
-    if "net::err_name_not_resolved" in s:
-        return "Domain not found — check the URL"
-    if "net::err_connection_refused" in s:
-        return "Connection refused — site may be down"
-    if "net::err_connection_timed_out" in s:
-        return "Connection timed out — site may be slow or unreachable"
-    if "net::err_ssl" in s or "certificate" in s:
-        return "SSL certificate error"
-    if "net::err_aborted" in s:
-        return "Page load aborted — site may be blocking automated access"
-    if "net::err_failed" in s:
-        return "Network request failed — site may be blocking automated browsers"
-    if "blocked" in s:
-        return "Page load blocked — site is rejecting automated browsers"
+    for pattern, message in _PAGE_ERROR_TABLE:
+        if pattern.search(raw):
+            return message
     return raw
 
 
@@ -149,159 +191,237 @@ def build_script_record(
 # Page inspection
 # ---------------------------------------------------------------------------
 
-def extract_inline_scripts(page: Page) -> list:
-    """Return records for all non-empty inline <script> tags."""
-    try:
-        contents = page.eval_on_selector_all(
-            "script:not([src])",
-            "els => els.map(el => el.textContent || '')"
-        )
-    except Exception:
-        return []
+# Inline script bodies + external script srcs, collected in one CDP round-trip
+_DOM_SNAPSHOT_JS = """() => ({
+    inline: [...document.querySelectorAll('script:not([src])')].map(el => el.textContent || ''),
+    external: [...document.querySelectorAll('script[src]')].map(el => el.src),
+})"""
 
-    records = []
-    for content in contents:
+class _ScriptCapture:
+    """Script requests seen on a page, fed by Playwright network events.
+
+    Page events cover every frame, including out-of-process (cross-origin)
+    iframes. Handlers bail on the resource type first, since most events
+    are images, fonts and XHRs. Shared by the sync and async audit paths.
+    """
+
+    def __init__(self):
+        self.captured_requests: dict = {}  # insertion-ordered set of script URLs
+        self.failed_requests: dict = {}  # url -> block_reason string
+        self.gtm_detected = False
+        self.last_script_ts = time.monotonic()
+
+    def listen(self, page) -> None:
+        page.on("request", self._handle_request)
+        page.on("requestfailed", self._handle_request_failed)
+        page.on("response", self._handle_response)
+
+    def unlisten(self, page) -> None:
+        page.remove_listener("request", self._handle_request)
+        page.remove_listener("requestfailed", self._handle_request_failed)
+        page.remove_listener("response", self._handle_response)
+
+    def is_settling(self, settle_start: float) -> bool:
+        """True while script traffic is still active and the settle cap isn't reached."""
+        now = time.monotonic()
+        return (now - self.last_script_ts < _SETTLE_QUIET_S
+                and now - settle_start < _SETTLE_MAX_S)
+
+    def _handle_request(self, request) -> None:
+        if request.resource_type != "script":
+            return
+        self.last_script_ts = time.monotonic()
+        req_url = request.url
+        if is_filtered_url(req_url):
+            return
+        self.captured_requests.setdefault(req_url, None)
+        if is_gtm_request(req_url):
+            self.gtm_detected = True
+
+    def _handle_request_failed(self, request) -> None:
+        if request.resource_type != "script":
+            return
+        self.last_script_ts = time.monotonic()
+        req_url = request.url
+        if is_filtered_url(req_url):
+            return
+        self.failed_requests[req_url] = classify_error(request.failure or "")
+        # Still track it so it appears in results
+        self.captured_requests.setdefault(req_url, None)
+
+    def _handle_response(self, response) -> None:
+        if response.request.resource_type != "script":
+            return
+        self.last_script_ts = time.monotonic()
+        status = response.status
+        if status in (401, 403, 404, 429) or status >= 500:
+            req_url = response.url
+            if not is_filtered_url(req_url):
+                self.failed_requests[req_url] = classify_error(str(status))
+
+
+def _build_result(url: str, capture: _ScriptCapture, snapshot: dict) -> dict:
+    """Combine the network capture and DOM snapshot into an audit result."""
+    failed_requests = capture.failed_requests
+
+    # One record per (url, type), first occurrence wins: inline scripts,
+    # then external scripts present in the DOM, then dynamic scripts
+    # (network-captured but not in the DOM snapshot)
+    records: dict = {}
+    for content in snapshot["inline"]:
         content = content.strip()
         if not content:
             continue
-        vendor = infer_vendor_from_inline(content)
-        records.append(build_script_record("inline", "inline", vendor, False, "inline"))
-    return records
+        # All inline records share the ("inline", "inline") key: keep the first
+        records[("inline", "inline")] = build_script_record(
+            "inline", "inline", infer_vendor_from_inline(content), False, "inline"
+        )
+        break
+
+    def add_external(script_url: str, via_gtm: bool) -> None:
+        key = (script_url, "external")
+        if key in records:
+            return
+        records[key] = build_script_record(
+            script_url, infer_name(script_url), lookup_vendor(script_url),
+            via_gtm, "external",
+            blocked=script_url in failed_requests,
+            block_reason=failed_requests.get(script_url),
+        )
 
+    # dict.fromkeys dedups while keeping DOM order, so output is reproducible
+    for script_url in dict.fromkeys(u for u in snapshot["external"] if u):
+        add_external(script_url, False)
+    for script_url in capture.captured_requests:
+        add_external(script_url, capture.gtm_detected)
 
-def get_dom_script_urls(page: Page) -> set:
-    """Return the set of absolute src URLs from <script src> elements in the DOM."""
-    try:
-        urls = page.eval_on_selector_all(
-            "script[src]",
-            "els => els.map(el => el.src)"
-        )
-        return set(u for u in urls if u)
-    except Exception:
-        return set()
+    return {
+        "url": url,
+        "scanned_at": _now_iso(),
+        "gtm_detected": capture.gtm_detected,
+        "error": None,
+        "scripts": list(records.values()),
+    }
+
+
+def _page_error_result(url: str, exc: Exception) -> dict:
+    return {
+        "url": url,
+        "scanned_at": _now_iso(),
+        "gtm_detected": False,
+        "error": classify_page_error(str(exc)),
+        "scripts": [],
+    }
 
 
 # ---------------------------------------------------------------------------
 # Core audit
 # ---------------------------------------------------------------------------
 
-def audit_url(url: str, browser: Browser, timeout_ms: int) -> dict:
-    """Audit a single URL and return a result dict."""
-    context = browser.new_context(
-        user_agent=(
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/121.0.0.0 Safari/537.36"
-        )
-    )
-    page = context.new_page()
-
-    captured_requests: list = []
-    failed_requests: dict = {}  # url -> block_reason string
-    gtm_detected = False
-
-    def handle_request(request):
-        nonlocal gtm_detected
-        if request.resource_type == "script":
-            req_url = request.url
-            if is_filtered_url(req_url):
-                return
-            captured_requests.append(req_url)
-            if is_gtm_request(req_url):
-                gtm_detected = True
-
-    def handle_request_failed(request):
-        if request.resource_type == "script":
-            req_url = request.url
-            if is_filtered_url(req_url):
-                return
-            reason = classify_error(request.failure or "")
-            failed_requests[req_url] = reason
-            # Still track it so it appears in results
-            if req_url not in captured_requests:
-                captured_requests.append(req_url)
-
-    def handle_response(response):
-        if response.request.resource_type == "script":
-            status = response.status
-            if status in (401, 403, 404, 429) or status >= 500:
-                req_url = response.url
-                if not is_filtered_url(req_url):
-                    reason = classify_error(str(status))
-                    failed_requests[req_url] = reason
-
-    page.on("request", handle_request)
-    page.on("requestfailed", handle_request_failed)
-    page.on("response", handle_response)
+def new_audit_context(browser):
+    """Create a browser context configured for auditing.
+
+    Works with sync and async browsers; await the result for the latter.
+    """
+    return browser.new_context(user_agent=_USER_AGENT)
+
+
+# Stands in for the DOM snapshot when page.evaluate fails
+_EMPTY_SNAPSHOT = {"inline": [], "external": []}
+
+
+def _audit_steps(page, url: str, timeout_ms: int, block_media: bool, capture: _ScriptCapture):
+    """The audit sequence, shared by the sync and async paths.
+
+    A generator yielding (fn, args, kwargs) Playwright calls. The driver runs
+    each call (awaiting it on the async path) and sends back its result or
+    throws back its exception; the audit result is the generator's return
+    value. Listeners and the blocking route are left for the caller to clean up.
+    """
+    capture.listen(page)
+    if block_media:
+        yield page.route, (_BLOCKED_URL_RE, _block_route), {}
 
     try:
-        page.goto(url, wait_until="networkidle", timeout=timeout_ms)
+        yield page.goto, (url,), {"wait_until": "load", "timeout": timeout_ms}
     except Exception as e:
-        context.close()
-        return {
-            "url": url,
-            "scanned_at": _now_iso(),
-            "gtm_detected": False,
-            "error": classify_page_error(str(e)),
-            "scripts": [],
-        }
-
-    # Extra buffer for late-firing GTM tags
+        return _page_error_result(url, e)
+
+    # Wait for script traffic to go quiet so late-firing GTM tags are caught
+    settle_start = time.monotonic()
     try:
-        page.wait_for_timeout(2000)
+        while capture.is_settling(settle_start):
+            yield page.wait_for_timeout, (100,), {}
     except Exception:
         pass
 
-    # Snapshot DOM scripts (present in initial HTML or injected synchronously)
-    dom_script_urls = get_dom_script_urls(page)
-
-    # Inline scripts
-    inline_records = extract_inline_scripts(page)
-
-    # External scripts present in the DOM
-    dom_external_records = []
-    for script_url in dom_script_urls:
-        name = infer_name(script_url)
-        vendor = lookup_vendor(script_url)
-        blocked = script_url in failed_requests
-        dom_external_records.append(
-            build_script_record(script_url, name, vendor, False, "external",
-                                blocked=blocked,
-                                block_reason=failed_requests.get(script_url))
-        )
+    try:
+        snapshot = yield page.evaluate, (_DOM_SNAPSHOT_JS,), {}
+    except Exception:
+        snapshot = _EMPTY_SNAPSHOT
+    return _build_result(url, capture, snapshot)
 
-    # Dynamic scripts = network-captured but not in the DOM snapshot
-    dynamic_records = []
-    for script_url in captured_requests:
-        if script_url not in dom_script_urls:
-            name = infer_name(script_url)
-            vendor = lookup_vendor(script_url)
-            blocked = script_url in failed_requests
-            dynamic_records.append(
-                build_script_record(script_url, name, vendor, gtm_detected, "external",
-                                    blocked=blocked,
-                                    block_reason=failed_requests.get(script_url))
-            )
 
-    context.close()
+def _drive(steps) -> dict:
+    """Run _audit_steps against the sync Playwright API."""
+    value, error = None, None
+    while True:
+        try:
+            fn, args, kwargs = steps.throw(error) if error else steps.send(value)
+        except StopIteration as done:
+            return done.value
+        try:
+            value, error = fn(*args, **kwargs), None
+        except Exception as e:
+            value, error = None, e
 
-    # Combine and deduplicate by (url, type)
-    all_scripts = inline_records + dom_external_records + dynamic_records
-    seen = set()
-    deduped = []
-    for s in all_scripts:
-        key = (s["url"], s["type"])
-        if key not in seen:
-            seen.add(key)
-            deduped.append(s)
 
-    return {
-        "url": url,
-        "scanned_at": _now_iso(),
-        "gtm_detected": gtm_detected,
-        "error": None,
-        "scripts": deduped,
-    }
+async def _drive_async(steps) -> dict:
+    """Run _audit_steps against the async Playwright API."""
+    value, error = None, None
+    while True:
+        try:
+            fn, args, kwargs = steps.throw(error) if error else steps.send(value)
+        except StopIteration as done:
+            return done.value
+        try:
+            value, error = await fn(*args, **kwargs), None
+        except Exception as e:
+            value, error = None, e
+
+
+def audit_on_page(page: Page, url: str, timeout_ms: int, block_media: bool = True) -> dict:
+    """Audit a single URL on an existing page and return a result dict.
+
+    Network listeners and the media-blocking route are removed
+    before returning, so the page can be reused for another audit. With
+    block_media, image/font/media requests are aborted to speed up loading.
+    """
+    capture = _ScriptCapture()
+    try:
+        return _drive(_audit_steps(page, url, timeout_ms, block_media, capture))
+    finally:
+        capture.unlisten(page)
+        if block_media:
+            try:
+                page.unroute(_BLOCKED_URL_RE, _block_route)
+            except Exception:
+                pass
+
+
+async def audit_url_async(
+    url: str, browser: AsyncBrowser, sem: asyncio.Semaphore, timeout_ms: int,
+    block_media: bool = True
+) -> dict:
+    """Audit a single URL in a fresh context once a slot in sem is free."""
+    async with sem:
+        context = await new_audit_context(browser)
+        try:
+            page = await context.new_page()
+            steps = _audit_steps(page, url, timeout_ms, block_media, _ScriptCapture())
+            return await _drive_async(steps)
+        finally:
+            await context.close()
 
 
 def _now_iso() -> str:
@@ -353,8 +473,8 @@ def print_result(result: dict, verbose: bool, index: int = None, total: int = No
 
 def save_results(results, output_path: str) -> None:
     os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
     print(f"\nResults saved to: {output_path}")
 
 
@@ -390,11 +510,23 @@ def parse_args() -> argparse.Namespace:
         metavar="SECONDS",
         help="Timeout per URL in seconds (default: 30)",
     )
+    parser.add_argument(
+        "--concurrency", "-c",
+        type=int,
+        default=4,
+        metavar="N",
+        help="Number of URLs audited in parallel (default: 4)",
+    )
     parser.add_argument(
         "--no-headless",
         action="store_true",
         help="Show the browser window (useful for debugging)",
     )
+    parser.add_argument(
+        "--no-block-media",
+        action="store_true",
+        help="Let the page load images, fonts and media (slower, closer to a real visit)",
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -415,12 +547,12 @@ def load_urls(args: argparse.Namespace) -> list:
         file_path = Path(args.file)
         if not file_path.exists():
             sys.exit(f"Error: file not found: {args.file}")
-        lines = file_path.read_text(encoding="utf-8").splitlines()
-        urls = [
-            line.strip()
-            for line in lines
-            if line.strip() and not line.strip().startswith("#")
-        ]
+        with file_path.open(encoding="utf-8") as fh:
+            urls = [
+                stripped
+                for line in fh
+                if (stripped := line.strip()) and not stripped.startswith("#")
+            ]
         if not urls:
             sys.exit(f"Error: no URLs found in {args.file}")
 
@@ -440,26 +572,42 @@ def load_urls(args: argparse.Namespace) -> list:
 # Orchestrator
 # ---------------------------------------------------------------------------
 
-def run_audit(urls: list, args: argparse.Namespace) -> None:
+async def _run_async(urls: list, args: argparse.Namespace, results: list) -> None:
+    """Audit urls concurrently in one browser, storing each result in results[i]."""
     timeout_ms = args.timeout * 1000
-    headless = not args.no_headless
     total = len(urls)
+    sem = asyncio.Semaphore(max(1, args.concurrency))
+
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=not args.no_headless)
+
+        async def run_one(i: int, url: str) -> None:
+            # One failing URL must not take the rest of the batch down with it
+            try:
+                result = await audit_url_async(
+                    url, browser, sem, timeout_ms, block_media=not args.no_block_media
+                )
+            except Exception as e:
+                result = _page_error_result(url, e)
+            results[i] = result
+            print_result(result, args.verbose, index=i + 1, total=total)
+
+        try:
+            await asyncio.gather(*(run_one(i, url) for i, url in enumerate(urls)))
+        finally:
+            await browser.close()
+
 
+def run_audit(urls: list, args: argparse.Namespace) -> None:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_path = args.output or f"output/audit_{timestamp}.json"
 
-    results = []
-    with sync_playwright() as pw:
-        browser = pw.chromium.launch(headless=headless)
-        try:
-            for i, url in enumerate(urls, start=1):
-                result = audit_url(url, browser, timeout_ms)
-                results.append(result)
-                print_result(result, args.verbose, index=i, total=total)
-        except KeyboardInterrupt:
-            print("\nInterrupted. Saving partial results...")
-        finally:
-            browser.close()
+    results = [None] * len(urls)
+    try:
+        asyncio.run(_run_async(urls, args, results))
+    except KeyboardInterrupt:
+        print("\nInterrupted. Saving partial results...")
+    results = [r for r in results if r is not None]
 
     output_data = results[0] if len(results) == 1 else results
     save_results(output_data, output_path)
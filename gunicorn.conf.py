@@ -1,14 +1,29 @@
 # Gunicorn configuration for script-auditor
 # SSE requires long-lived connections → use sync workers with long timeout
 
+import os
+
 bind = "127.0.0.1:7070"
 workers = 1          # must be 1 — job queue is in-process memory, not shared across workers
-threads = 8          # handle concurrent audits + SSE streams within the single worker
+# Request threads never touch Playwright: each browser is owned by one of the
+# app's POOL_SIZE pool threads (see BrowserPool in app.py). These threads only
+# accept jobs and hold SSE streams open, so allow one per queued audit
+# (MAX_QUEUE) plus headroom for new requests. The "16" default must match
+# MAX_QUEUE in app.py; it isn't imported because loading app here would start
+# the browser pool in the gunicorn master.
+threads = int(os.environ.get("MAX_QUEUE", "16")) + 4
 timeout = 180        # seconds — must exceed max audit timeout (120s) + buffer
 keepalive = 5
 worker_class = "sync"
+preload_app = False  # the browser pool's threads would not survive the fork
 
 # Logging (local dev: stderr; VPS: use full paths)
 accesslog = "-"
 errorlog  = "-"
 loglevel  = "info"
+
+
+def worker_exit(server, worker):
+    # Stop the app's Chromium instances and Playwright drivers cleanly
+    from app import pool
+    pool.shutdown()
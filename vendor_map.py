@@ -1,3 +1,10 @@
+from functools import lru_cache, partial
+
+try:
+    import ahocorasick
+except ImportError:  # optional speedup — lookups fall back to generated code
+    ahocorasick = None
+
 # Ordered list of (substring, vendor_name) tuples.
 # First match wins — keep more specific patterns before general ones.
 VENDOR_PATTERNS = [
@@ -136,6 +143,9 @@ VENDOR_PATTERNS = [
     ("jsdelivr.net",                            "jsDelivr CDN"),
 ]
 
+# VENDOR_PATTERNS with the substrings lower-cased once, for matching lowered URLs
+_VENDOR_PATTERNS_LC = [(pattern.lower(), vendor) for pattern, vendor in VENDOR_PATTERNS]
+
 # Inline script fingerprints: (content_substring, vendor_name)
 _INLINE_FINGERPRINTS = [
     ("gtag(",                   "Google Analytics 4 (gtag)"),
@@ -163,6 +173,57 @@ _INLINE_FINGERPRINTS = [
 ]
 
 
+def _build_automaton(patterns: list):
+    """Compile (substring, vendor) pairs into an Aho–Corasick automaton.
+
+    Each word maps to (index, vendor) so matches can be ranked by list order.
+    """
+    automaton = ahocorasick.Automaton()
+    for index, (pattern, vendor) in enumerate(patterns):
+        if not automaton.exists(pattern):
+            automaton.add_word(pattern, (index, vendor))
+    automaton.make_automaton()
+    return automaton
+
+
+def _first_match(automaton, text: str) -> str:
+    """Return the vendor of the earliest-listed pattern found in text."""
+    best = None
+    for _end, (index, vendor) in automaton.iter(text):
+        if index == 0:
+            return vendor
+        if best is None or index < best[0]:
+            best = (index, vendor)
+    return best[1] if best else "Unknown"
+
+
+def _compile_matcher(patterns: list):
+    """Generate a function testing each (substring, vendor) pair in order.
+
+    The emitted source is a straight-line chain of literal `in` checks, so a
+    lookup runs without loop or tuple-unpacking overhead. First match wins.
+    """
+    lines = ["def _match(text):"]
+    for pattern, vendor in patterns:
+        lines.append(f"    if {pattern!r} in text: return {vendor!r}")
+    lines.append('    return "Unknown"')
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_match"]
+
+
+# text -> vendor matchers; _match_url expects an already lower-cased URL.
+# Inline bodies always use the `in` chain: fingerprints like "dataLayer" repeat
+# throughout GTM snippets, and stopping at the first hit in C beats walking
+# every automaton match in Python.
+if ahocorasick is not None:
+    _match_url = partial(_first_match, _build_automaton(_VENDOR_PATTERNS_LC))
+else:
+    _match_url = _compile_matcher(_VENDOR_PATTERNS_LC)
+_match_inline = _compile_matcher(_INLINE_FINGERPRINTS)
+
+
+@lru_cache(maxsize=4096)
 def lookup_vendor(url: str) -> str:
     """Return the vendor name for a script URL, or 'Unknown'."""
     lowered = url.lower()
@@ -170,15 +231,9 @@ def lookup_vendor(url: str) -> str:
     if ("/gtm.js" in lowered and "id=gtm-" in lowered) or \
        ("/gtag/js" in lowered and ("id=g-" in lowered or "id=gtm-" in lowered)):
         return "Google Tag Manager"
-    for pattern, vendor in VENDOR_PATTERNS:
-        if pattern.lower() in lowered:
-            return vendor
-    return "Unknown"
+    return _match_url(lowered)
 
 
 def infer_vendor_from_inline(content: str) -> str:
     """Best-effort vendor detection from inline script content."""
-    for fingerprint, vendor in _INLINE_FINGERPRINTS:
-        if fingerprint in content:
-            return vendor
-    return "Unknown"
+    return _match_inline(content)